@@ -13,10 +13,16 @@ License: MIT
 from .quantum_canvas import QuantumCanvas, QuantumConfig, ArtResult, DEFAULT_CONFIG
 from .utils import (
     hash_name_to_seed,
-    seed_to_parameters,
+    hash_names_to_seeds,
+    name_to_parameters,
+    names_to_parameters_batch,
+    names_to_seeds_and_parameters,
     hamming_weight,
+    hamming_weights,
     bitstring_to_int,
-    calculate_probability
+    calculate_probability,
+    calculate_probabilities,
+    weighted_hamming
 )
 
 __version__ = "1.0.0"
@@ -28,8 +34,14 @@ __all__ = [
     "ArtResult",
     "DEFAULT_CONFIG",
     "hash_name_to_seed",
-    "seed_to_parameters",
+    "hash_names_to_seeds",
+    "name_to_parameters",
+    "names_to_parameters_batch",
+    "names_to_seeds_and_parameters",
     "hamming_weight",
+    "hamming_weights",
     "bitstring_to_int",
     "calculate_probability",
+    "calculate_probabilities",
+    "weighted_hamming",
 ]
@@ -25,16 +25,18 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 import numpy as np
 from qiskit import QuantumCircuit, transpile
 from qiskit.circuit.library import EfficientSU2
 from qiskit_aer import AerSimulator
+from qiskit_aer.primitives import SamplerV2 as AerSampler
 
-from .utils import hash_name_to_seed, seed_to_parameters
+from .utils import hash_name_to_seed, name_to_parameters, names_to_seeds_and_parameters
 
 
 # ════════════════════════════════════════════════════════════════════════════
@@ -50,20 +52,25 @@ class QuantumConfig:
     - 5 qubits: fits on any IBM processor
     - 3 layers: sufficient expressibility without excessive depth
     - 100 shots: preserves quantum grain while conserving quota
+
+    Set device="GPU" for local simulation of large registers (roughly
+    20+ qubits, where CPU statevector simulation becomes memory-bound).
+    Requires the qiskit-aer-gpu package.
     """
     num_qubits: int = 5
     layers: int = 3
     shots: int = 100
-    
-    @property
-    def num_parameters(self) -> int:
-        """Total rotation angles: (layers + 1) × qubits × 2"""
-        return (self.layers + 1) * self.num_qubits * 2
-    
-    @property
-    def max_states(self) -> int:
-        """Maximum possible basis states: 2^n"""
-        return 2 ** self.num_qubits
+    device: str = "CPU"
+
+    # Derived once at construction rather than on every access:
+    # num_parameters = total rotation angles, (layers + 1) × qubits × 2
+    # max_states = maximum possible basis states, 2^n
+    num_parameters: int = field(init=False)
+    max_states: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'num_parameters', (self.layers + 1) * self.num_qubits * 2)
+        object.__setattr__(self, 'max_states', 2 ** self.num_qubits)
 
 
 DEFAULT_CONFIG = QuantumConfig()
@@ -77,23 +84,58 @@ DEFAULT_CONFIG = QuantumConfig()
 class ArtResult:
     """
     The outcome of a quantum art generation.
-    
+
     Contains the probability distribution that defines a unique
     visual universe—the quantum fingerprint of an identity.
+
+    The distribution is stored as two parallel arrays—basis-state
+    indices and their shot counts—so aggregation runs as NumPy
+    reductions. The bitstring-keyed dict view is materialized lazily,
+    only when something actually needs strings (e.g. JSON export).
     """
     name: str
     seed: int
-    counts: Dict[str, int]
+    states: np.ndarray
+    counts_array: np.ndarray
     config: QuantumConfig
     backend_name: str
-    
+
+    @classmethod
+    def from_counts(
+        cls,
+        name: str,
+        seed: int,
+        counts: Dict[str, int],
+        config: QuantumConfig,
+        backend_name: str
+    ) -> "ArtResult":
+        """Build a result from a bitstring-keyed counts dict."""
+        states = np.fromiter(
+            (int(bitstring, 2) for bitstring in counts),
+            dtype=np.uint32,
+            count=len(counts)
+        )
+        values = np.fromiter(counts.values(), dtype=np.uint32, count=len(counts))
+
+        order = np.argsort(states)
+        return cls(name, seed, states[order], values[order], config, backend_name)
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Bitstring-keyed view of the distribution (built on demand)."""
+        width = self.config.num_qubits
+        return {
+            format(int(state), f'0{width}b'): int(count)
+            for state, count in zip(self.states, self.counts_array)
+        }
+
     @property
     def total_shots(self) -> int:
-        return sum(self.counts.values())
-    
+        return int(self.counts_array.sum())
+
     @property
     def num_states(self) -> int:
-        return len(self.counts)
+        return int(self.counts_array.size)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -123,8 +165,9 @@ class QuantumCanvas:
     Transform names into quantum probability distributions.
     
     This class orchestrates the entire pipeline:
-    1. Name → deterministic seed via SHA-256
-    2. Seed → rotation angles uniformly distributed in [0, 2π]
+    1. Name → deterministic SHA-256 digest (first 4 bytes kept as the
+       seed in result metadata)
+    2. Digest → rotation angles in [0, 2π) via counter-mode expansion
     3. Angles → parameterized EfficientSU2 circuit
     4. Circuit → measurement counts (the quantum fingerprint)
     
@@ -143,12 +186,75 @@ class QuantumCanvas:
         self.use_cloud = use_cloud
         self._service = None
         self._backend = None
-        
+        self._sampler = None
+        self._ansatz = None
+        self._measured_ansatz = None
+        self._template_circuit = None
+        self._make_circuit = None
+
+        # Specialized for this config: histogram byte weights depend only
+        # on num_qubits, so they are resolved once here instead of per shot
+        # batch.
+        num_bytes = -(-self.config.num_qubits // 8)
+        self._byte_weights = np.uint64(1) << np.arange(
+            8 * (num_bytes - 1), -1, -8, dtype=np.uint64
+        )
+
     @property
     def backend(self):
         if self._backend is None:
             self._backend = self._initialize_backend()
         return self._backend
+
+    @property
+    def sampler(self):
+        """
+        The SamplerV2 primitive that executes circuits.
+
+        Local and cloud execution share the same primitive interface;
+        only the construction differs, so everything downstream of here
+        is a single code path.
+        """
+        if self._sampler is None:
+            if self.use_cloud:
+                from qiskit_ibm_runtime import SamplerV2 as Sampler
+                self._sampler = Sampler(mode=self.backend)
+            else:
+                self._sampler = AerSampler.from_backend(self.backend)
+        return self._sampler
+
+    @property
+    def template_circuit(self) -> QuantumCircuit:
+        """
+        The measured, transpiled ansatz with its parameters still unbound.
+
+        Transpilation is a pure function of the circuit structure and the
+        backend—not of the rotation angles—so it only needs to run once.
+        Per-name circuits are then produced by `assign_parameters`, which
+        is a cheap substitution rather than a full pass-manager run.
+        """
+        if self._template_circuit is None:
+            # The simulator has all-to-all connectivity, so routing and
+            # heavy synthesis buy nothing for the fixed ansatz; only real
+            # hardware needs the full optimization pipeline.
+            level = 3 if self.use_cloud else 0
+            template = transpile(
+                self._measured_ansatz_circuit(),
+                backend=self.backend,
+                optimization_level=level
+            )
+
+            # Validate the parameter count once; per-name binding can then
+            # skip the length check entirely.
+            if template.num_parameters != self.config.num_parameters:
+                raise ValueError(
+                    f"Template has {template.num_parameters} parameters, "
+                    f"expected {self.config.num_parameters}"
+                )
+
+            self._template_circuit = template
+            self._make_circuit = template.assign_parameters
+        return self._template_circuit
     
     def _initialize_backend(self):
         if self.use_cloud:
@@ -160,30 +266,59 @@ class QuantumCanvas:
             print(f"✓ Selected: {backend.name}")
             return backend
         else:
-            print("🖥️  Using local AerSimulator")
-            return AerSimulator()
+            if self.config.device == "GPU":
+                print("🖥️  Using local AerSimulator (GPU statevector)")
+                backend = AerSimulator(
+                    method="statevector",
+                    device="GPU",
+                    batched_shots_gpu=True
+                )
+                if self.config.num_qubits >= 20:
+                    # Cache-blocking: evolve the statevector in chunks so
+                    # large registers stream through GPU memory.
+                    backend.set_options(blocking_enable=True, blocking_qubits=23)
+            else:
+                print("🖥️  Using local AerSimulator")
+                backend = AerSimulator()
+            # Split multi-circuit jobs into per-circuit Aer jobs and run them
+            # on a persistent thread pool: the executor parallelizes across
+            # circuits while Aer's OpenMP threads parallelize within each.
+            backend.set_options(
+                executor=ThreadPoolExecutor(max_workers=os.cpu_count()),
+                max_job_size=1
+            )
+            return backend
     
     def _build_ansatz(self) -> EfficientSU2:
-        """Construct the variational ansatz."""
-        return EfficientSU2(
-            num_qubits=self.config.num_qubits,
-            su2_gates=['ry', 'rz'],
-            entanglement='full',
-            reps=self.config.layers
-        )
-    
-    def _build_circuit(self, parameters: np.ndarray) -> QuantumCircuit:
-        ansatz = self._build_ansatz()
-        
-        if len(parameters) != ansatz.num_parameters:
-            raise ValueError(
-                f"Expected {ansatz.num_parameters} parameters, got {len(parameters)}"
+        """Construct the variational ansatz (built once, then reused)."""
+        if self._ansatz is None:
+            self._ansatz = EfficientSU2(
+                num_qubits=self.config.num_qubits,
+                su2_gates=['ry', 'rz'],
+                entanglement='full',
+                reps=self.config.layers
             )
-        
-        circuit = ansatz.assign_parameters(parameters)
-        circuit.measure_all()
-        return circuit
-    
+        return self._ansatz
+
+    def _bind_template(self, parameters: np.ndarray) -> QuantumCircuit:
+        """
+        Bind rotation angles onto the cached transpiled template.
+
+        Binding positionally with a NumPy array lets Qiskit map values
+        onto the template's ParameterVector in bulk, and the parameter
+        count is checked once when the template is built, so each name
+        costs exactly one monomorphic assign_parameters call.
+        """
+        if self._make_circuit is None:
+            _ = self.template_circuit  # builds template and binder
+        return self._make_circuit(parameters)
+
+    def _measured_ansatz_circuit(self) -> QuantumCircuit:
+        """The ansatz with measurements, still parameterized (built once)."""
+        if self._measured_ansatz is None:
+            self._measured_ansatz = self._build_ansatz().measure_all(inplace=False)
+        return self._measured_ansatz
+
     def generate_art(self, user_name: str) -> ArtResult:
         """
         Generate a quantum fingerprint for a name.
@@ -194,23 +329,23 @@ class QuantumCanvas:
         print(f"\n🎨 Generating art for: '{user_name}'")
         
         seed = hash_name_to_seed(user_name)
-        parameters = seed_to_parameters(seed, self.config.num_parameters)
+        parameters = name_to_parameters(user_name, self.config.num_parameters)
         
         print(f"   Seed: {seed}")
         print(f"   Parameters: {self.config.num_parameters}")
         
-        circuit = self._build_circuit(parameters)
-        transpiled = transpile(circuit, backend=self.backend, optimization_level=3)
-        
+        circuit = self._bind_template(parameters)
+
         print(f"   Executing on {self.backend.name} ({self.config.shots} shots)...")
-        counts = self._execute_circuit(transpiled)
-        
-        print(f"   ✓ Generated {len(counts)} unique quantum states")
-        
+        states, counts = self._run([circuit])[0]
+
+        print(f"   ✓ Generated {states.size} unique quantum states")
+
         return ArtResult(
             name=user_name,
             seed=seed,
-            counts=counts,
+            states=states,
+            counts_array=counts,
             config=self.config,
             backend_name=self.backend.name
         )
@@ -222,30 +357,29 @@ class QuantumCanvas:
         
         print(f"\n🎨 Batch generating art for {len(names)} names...")
         
-        circuits = []
-        metadata = []
-        
-        for name in names:
-            seed = hash_name_to_seed(name)
-            params = seed_to_parameters(seed, self.config.num_parameters)
-            circuit = self._build_circuit(params)
-            
-            circuits.append(circuit)
-            metadata.append({"name": name, "seed": seed})
-            print(f"   Prepared: {name}")
-        
-        print(f"   Transpiling {len(circuits)} circuits...")
-        transpiled = transpile(circuits, backend=self.backend, optimization_level=3)
-        
+        # Deliberately serial: setup is one SHA-256 per name and the
+        # binding happens inside the sampler, so there is no chunk of
+        # Python work left that would outweigh worker-pool overhead.
+        seeds, all_params = names_to_seeds_and_parameters(
+            names, self.config.num_parameters
+        )
+
+        metadata = [
+            {"name": name, "seed": int(seed)}
+            for name, seed in zip(names, seeds)
+        ]
+        print(f"   Prepared {len(names)} parameter sets")
+
         print(f"   Executing batch on {self.backend.name}...")
-        all_counts = self._execute_circuits_batch(transpiled)
-        
+        all_histograms = self._run_parameter_sweep(all_params)
+
         results = []
-        for i, counts in enumerate(all_counts):
+        for i, (states, counts) in enumerate(all_histograms):
             result = ArtResult(
                 name=metadata[i]["name"],
                 seed=metadata[i]["seed"],
-                counts=counts,
+                states=states,
+                counts_array=counts,
                 config=self.config,
                 backend_name=self.backend.name
             )
@@ -255,43 +389,71 @@ class QuantumCanvas:
         print(f"   ✓ Batch complete!")
         return results
     
-    def _execute_circuit(self, circuit: QuantumCircuit) -> Dict[str, int]:
+    def _histogram_shots(self, packed: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Histogram packed measurement bytes into state/count arrays.
+
+        `get_counts` would materialize a Python bitstring per shot; here
+        the sampler's packed bytes (shots × bytes, big-endian) are
+        combined into integer states and binned with np.bincount, so the
+        whole histogram happens in C and lands directly in the array
+        form ArtResult stores.
+        """
+        packed = np.asarray(packed, dtype=np.uint64)
+
+        byte_weights = self._byte_weights
+        if packed.shape[-1] != byte_weights.size:
+            byte_weights = np.uint64(1) << np.arange(
+                8 * (packed.shape[-1] - 1), -1, -8, dtype=np.uint64
+            )
+        values = packed @ byte_weights
+
+        # np.unique allocates proportionally to the shot count, never to
+        # the largest observed state—a dense histogram would be gigabytes
+        # for large registers.
+        states, counts = np.unique(values, return_counts=True)
+        return states.astype(np.uint32), counts.astype(np.uint32)
+
+    def _run_parameter_sweep(self, parameter_sets: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Execute the template over many parameter rows as one PUB.
+
+        Every circuit in a batch shares the template's gate structure
+        and differs only in rotation angles, so the whole sweep goes to
+        the sampler as a single (circuit, parameter_array) PUB: one
+        classical compilation, with the N bindings done inside the
+        primitive rather than as N Python-built circuits.
+
+        On the cloud path the template is already transpiled to the
+        hardware's ISA, so IBM's server compiles it once and sweeps the
+        parameter rows—one circuit plus an (N, num_params) array over
+        the wire instead of N full circuits.
+        """
+        job = self.sampler.run(
+            [(self.template_circuit, parameter_sets)],
+            shots=self.config.shots
+        )
+
         if self.use_cloud:
-            return self._execute_cloud([circuit])[0]
-        else:
-            return self._execute_local([circuit])[0]
-    
-    def _execute_circuits_batch(self, circuits: List[QuantumCircuit]) -> List[Dict[str, int]]:
+            print(f"   Job ID: {job.job_id()}")
+            print(f"   Waiting for results...")
+
+        raw = np.asarray(job.result()[0].data.meas.array)
+        return [self._histogram_shots(raw[i]) for i in range(len(parameter_sets))]
+
+    def _run(self, circuits: List[QuantumCircuit]) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Execute circuits through the sampler and return per-circuit histograms."""
+        job = self.sampler.run(circuits, shots=self.config.shots)
+
         if self.use_cloud:
-            return self._execute_cloud(circuits)
-        else:
-            return self._execute_local(circuits)
-    
-    def _execute_local(self, circuits: List[QuantumCircuit]) -> List[Dict[str, int]]:
-        results = []
-        for circuit in circuits:
-            job = self.backend.run(circuit, shots=self.config.shots)
-            result = job.result()
-            counts = result.get_counts(circuit)
-            results.append(counts)
-        return results
-    
-    def _execute_cloud(self, circuits: List[QuantumCircuit]) -> List[Dict[str, int]]:
-        from qiskit_ibm_runtime import SamplerV2 as Sampler
-        
-        sampler = Sampler(mode=self.backend)
-        job = sampler.run(circuits, shots=self.config.shots)
-        print(f"   Job ID: {job.job_id()}")
-        print(f"   Waiting for results...")
-        
+            print(f"   Job ID: {job.job_id()}")
+            print(f"   Waiting for results...")
+
         result = job.result()
-        
-        all_counts = []
-        for i in range(len(circuits)):
-            counts = result[i].data.meas.get_counts()
-            all_counts.append(counts)
-        
-        return all_counts
+        return [
+            self._histogram_shots(pub_result.data.meas.array)
+            for pub_result in result
+        ]
     
     def export_hardware_map(self, output_path: Optional[str] = None) -> Optional[str]:
         """Export quantum processor topology as proof of execution."""
@@ -314,16 +476,46 @@ class QuantumCanvas:
         self,
         result: ArtResult,
         output_path: Optional[str] = None,
-        full_metadata: bool = False
+        full_metadata: bool = False,
+        format: str = "json"
     ) -> str:
-        output_path = output_path or "web/quantum_data.json"
+        """
+        Persist a result for the frontend or for later analysis.
+
+        Formats:
+        - "json": bitstring-keyed counts (what web/sketch.js reads)
+        - "npz":  compressed state/count arrays—8 bytes per state
+                  instead of ASCII bitstrings, for large registers
+        - "bin":  raw little-endian uint32 (state, count) pairs for
+                  binary-capable consumers
+        """
+        output_path = output_path or f"web/quantum_data.{format}"
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        
-        data = result.to_dict() if full_metadata else result.to_frontend_json()
-        
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
-        
+
+        if format == "json":
+            data = result.to_dict() if full_metadata else result.to_frontend_json()
+            with open(output_path, 'w') as f:
+                json.dump(data, f, indent=2)
+        elif format == "npz":
+            # savez_compressed appends .npz to paths without it; normalize
+            # first so the printed and returned path is the real file.
+            output_path = str(Path(output_path).with_suffix('.npz'))
+            np.savez_compressed(
+                output_path,
+                states=result.states,
+                counts=result.counts_array,
+                num_qubits=result.config.num_qubits
+            )
+        elif format == "bin":
+            # Same normalization as npz: never leave raw binary behind a
+            # .json path the frontend would try to parse.
+            output_path = str(Path(output_path).with_suffix('.bin'))
+            pairs = np.column_stack((result.states, result.counts_array))
+            with open(output_path, 'wb') as f:
+                f.write(pairs.astype('<u4').tobytes())
+        else:
+            raise ValueError(f"Unknown format: {format!r}")
+
         abs_path = str(Path(output_path).absolute())
         print(f"✓ Saved: {abs_path}")
         return abs_path
@@ -351,6 +543,8 @@ Examples:
     parser.add_argument("--cloud", action="store_true", help="Use IBM Quantum cloud")
     parser.add_argument("--batch", action="store_true", help="Batch execution mode")
     parser.add_argument("--output", default="web/quantum_data.json", help="Output path")
+    parser.add_argument("--format", default="json", choices=["json", "npz", "bin"],
+                        help="Output format (json for the web frontend)")
     parser.add_argument("--full-meta", action="store_true", help="Include full metadata")
     
     args = parser.parse_args()
@@ -371,7 +565,7 @@ Examples:
     else:
         result = canvas.generate_art(args.names[0])
     
-    canvas.save_result(result, args.output, full_metadata=args.full_meta)
+    canvas.save_result(result, args.output, full_metadata=args.full_meta, format=args.format)
     
     if args.cloud:
         canvas.export_hardware_map()
@@ -7,43 +7,125 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+import functools
 import hashlib
 import numpy as np
-from typing import Tuple
+from typing import List, Tuple
+
+_TWO_PI = 2.0 * np.pi
+_MANTISSA_MASK = (1 << 53) - 1
+_ANGLE_SCALE = _TWO_PI * 2.0 ** -53  # maps a 53-bit word onto [0, 2π)
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_name(name: str) -> bytes:
+    """
+    Normalized UTF-8 form of a name, cached across repeat inputs.
+
+    Stripping, lowercasing and encoding allocate three strings per call;
+    batches with duplicate or revisited names skip all of that on a
+    cache hit.
+    """
+    if not name or not name.strip():
+        raise ValueError("Name cannot be empty")
+    return name.strip().lower().encode('utf-8')
+
+
+def _name_digest(name: str) -> bytes:
+    """
+    SHA-256 digest of the normalized name—the root of all derivation.
+
+    Both the 4-byte seed and the rotation angles are sliced or expanded
+    from this single digest, so each name is hashed exactly once.
+    """
+    return hashlib.sha256(_normalize_name(name)).digest()
 
 
 def hash_name_to_seed(name: str) -> int:
     """
     Transform a name into a deterministic integer seed.
-    
-    Uses SHA-256 to create a consistent fingerprint that seeds
-    the random number generator for parameter generation.
-    
+
+    Uses SHA-256 to create a consistent fingerprint that identifies
+    the name in result metadata and the frontend.
+
     The same name will always yield the same seed, ensuring
     reproducibility across runs and platforms.
     """
-    if not name or not name.strip():
-        raise ValueError("Name cannot be empty")
-    
-    normalized = name.strip().lower()
-    hash_bytes = hashlib.sha256(normalized.encode('utf-8')).digest()
-    seed = int.from_bytes(hash_bytes[:4], byteorder='big')
-    
-    return seed
+    return int.from_bytes(_name_digest(name)[:4], byteorder='big')
+
+
+def hash_names_to_seeds(names: List[str]) -> np.ndarray:
+    """
+    Hash a batch of names into a preallocated uint32 seed array.
+
+    Equivalent to calling `hash_name_to_seed` per name, without the
+    list-append churn in the caller.
+    """
+    seeds = np.empty(len(names), dtype=np.uint32)
+    for i, name in enumerate(names):
+        seeds[i] = int.from_bytes(_name_digest(name)[:4], byteorder='big')
+    return seeds
 
 
-def seed_to_parameters(seed: int, num_params: int) -> np.ndarray:
+def _digest_to_parameters(digest: bytes, num_params: int) -> np.ndarray:
     """
-    Generate rotation angles from a seed.
-    
-    Creates an array of angles uniformly distributed in [0, 2π]
-    that will parameterize the quantum circuit's rotation gates.
-    
-    These angles encode the unique identity of the input name
-    into the quantum circuit's structure.
+    Expand a name digest into rotation angles via SHA-256 counter mode.
+
+    Each digest of `H || counter` yields four 64-bit words; masking to
+    53 bits and scaling by 2π·2⁻⁵³ turns every word into a uniform angle
+    in [0, 2π). A 40-parameter circuit needs just ten hash calls—no
+    general-purpose RNG has to be seeded at all, and hashlib routes to
+    OpenSSL's hardware SHA path on modern CPUs.
     """
-    rng = np.random.default_rng(seed)
-    return rng.uniform(0, 2 * np.pi, num_params)
+    num_blocks = -(-num_params // 4)  # four 64-bit words per 32-byte digest
+    stream = b''.join(
+        hashlib.sha256(digest + i.to_bytes(4, byteorder='big')).digest()
+        for i in range(num_blocks)
+    )
+
+    words = np.frombuffer(stream, dtype='>u8')[:num_params]
+    return (words & _MANTISSA_MASK) * _ANGLE_SCALE
+
+
+def name_to_parameters(name: str, num_params: int) -> np.ndarray:
+    """
+    Expand a name directly into rotation angles.
+
+    The angles are a pure function of the name's SHA-256 digest, so the
+    same name still always produces the same art.
+    """
+    return _digest_to_parameters(_name_digest(name), num_params)
+
+
+def names_to_parameters_batch(names: List[str], num_params: int) -> np.ndarray:
+    """
+    Expand many names into rotation angles as one (N, num_params) array.
+
+    Row i matches `name_to_parameters(names[i], num_params)` exactly;
+    the rows are simply stacked into a contiguous array so batch callers
+    avoid building up a Python list of separate vectors.
+    """
+    return np.stack([name_to_parameters(name, num_params) for name in names])
+
+
+def names_to_seeds_and_parameters(names: List[str], num_params: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Derive seeds and rotation angles for a batch with one hash per name.
+
+    The name is digested once; the seed is sliced from the digest and
+    the angles are expanded from the same digest in counter mode. Both
+    outputs land in preallocated arrays: a (N,) uint32 seed vector and
+    an (N, num_params) angle matrix.
+    """
+    seeds = np.empty(len(names), dtype=np.uint32)
+    params = np.empty((len(names), num_params), dtype=np.float64)
+
+    for i, name in enumerate(names):
+        digest = _name_digest(name)
+        seeds[i] = int.from_bytes(digest[:4], byteorder='big')
+        params[i] = _digest_to_parameters(digest, num_params)
+
+    return seeds, params
 
 
 def bitstring_to_int(bitstring: str) -> int:
@@ -54,13 +136,63 @@ def bitstring_to_int(bitstring: str) -> int:
 def hamming_weight(bitstring: str) -> int:
     """
     Count the number of 1s in a bitstring.
-    
+
     In quantum mechanics, this represents the excitation level
     of the computational basis state—how many qubits are in |1⟩.
+
+    `int.bit_count()` compiles down to a single popcount instruction,
+    so this beats scanning the string character by character.
+    """
+    return int(bitstring, 2).bit_count()
+
+
+def hamming_weights(states: np.ndarray) -> np.ndarray:
     """
-    return bitstring.count('1')
+    Popcount an entire array of basis-state indices at once.
+
+    The bulk companion to `hamming_weight` for the array-based results:
+    uses NumPy's native bitwise_count where available (NumPy 2.0+) and
+    falls back to a SWAR popcount—the classic shift-and-mask bit-count
+    that needs no per-element Python dispatch—on older NumPy.
+    """
+    states = np.asarray(states, dtype=np.uint64)
+
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(states).astype(np.uint8)
+
+    x = states - ((states >> 1) & 0x5555555555555555)
+    x = (x & 0x3333333333333333) + ((x >> 2) & 0x3333333333333333)
+    x = (x + (x >> 4)) & 0x0F0F0F0F0F0F0F0F
+    return ((x * 0x0101010101010101) >> 56).astype(np.uint8)
 
 
 def calculate_probability(count: int, total_shots: int) -> float:
     """Calculate the empirical probability of a measurement outcome."""
     return count / total_shots if total_shots > 0 else 0.0
+
+
+def calculate_probabilities(counts: np.ndarray, total_shots: int) -> np.ndarray:
+    """
+    Normalize a whole histogram of counts in one division.
+
+    The array companion to `calculate_probability`: one C-level divide
+    over the counts array instead of a Python call per basis state.
+    """
+    counts = np.asarray(counts)
+    if total_shots <= 0:
+        return np.zeros(counts.shape, dtype=np.float64)
+    return counts.astype(np.float64) / total_shots
+
+
+def weighted_hamming(states: np.ndarray, counts: np.ndarray, total_shots: int) -> float:
+    """
+    Shot-weighted mean excitation level of a distribution.
+
+    Fuses the bulk popcount with the normalization into two NumPy
+    reductions—no Python-level loop over `counts.items()` required.
+    """
+    if total_shots <= 0:
+        return 0.0
+
+    weights = hamming_weights(states).astype(np.float64)
+    return float(weights @ np.asarray(counts, dtype=np.float64)) / total_shots